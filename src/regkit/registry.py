@@ -4,8 +4,8 @@ from __future__ import annotations
 
 import ntpath
 import winreg
-from functools import total_ordering
-from typing import Any, Callable, Iterator, Optional, Sequence, Tuple, Union, cast
+from functools import lru_cache, total_ordering
+from typing import Any, Callable, ClassVar, Iterable, Iterator, Mapping, Optional, Sequence, Tuple, Union, cast
 
 from typing_extensions import TypeAlias
 
@@ -56,9 +56,13 @@ class Key:
         "HKCC": "HKEY_CURRENT_CONFIG",
     }
 
+    # shared root key objects, keyed by (class, root handle, root name)
+    _root_key_cache: ClassVar[dict[tuple[type[Key], int, str], Key]] = {}
+
     _parent: Key | int
     _name: str
     _handle: HKeyTypeAlias | None
+    _folded_path: str | None
 
     @classmethod
     def _canonical_root_name_for_handle(cls, handle: int) -> str:
@@ -67,10 +71,24 @@ class Key:
                 return root_name
         return handle_to_str(handle)
 
+    @classmethod
+    def _root_key(cls, root: int, root_name: str) -> Key:
+        """Returns the shared key object for a root handle.
+
+        Root keys wrap a predefined handle that is never closed, so a single
+        instance is reused instead of constructing a new one per call.
+        """
+        cache_key = (cls, root, root_name)
+        try:
+            return cls._root_key_cache[cache_key]
+        except KeyError:
+            root_key = cls._root_key_cache[cache_key] = cls(root, root_name)
+            return root_key
+
     @classmethod
     def _create_rooted_key(cls, root: int, *subkeys: str, root_name: str) -> Key:
         """Creates a key object for a root key"""
-        root_key = cls(root, root_name)
+        root_key = cls._root_key(root, root_name)
         if not subkeys:
             return root_key
         return root_key.subkey(*subkeys)
@@ -135,15 +153,16 @@ class Key:
         if not path:
             raise ValueError("Path cannot be empty")
 
-        normalized = path.strip().replace("/", "\\")
-        parts = [p for p in normalized.split("\\") if p]
+        parts = cls._split_subkey_parts(path.strip())
         if not parts:
             raise ValueError("Path cannot be empty")
 
         return cls.from_parts(parts)
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _split_subkey_parts(name: str) -> tuple[str, ...]:
+        """Splits a path into its parts.  Memoized, as the same paths are split repeatedly."""
         return tuple(part for part in name.replace("/", "\\").split("\\") if part)
 
     def __init__(
@@ -157,6 +176,7 @@ class Key:
             raise ValueError("Key names cannot be empty")
         self._name = ntpath.join(*names) if names else (handle_to_str(parent) if not isinstance(parent, Key) else "")
         self._handle: Optional[HKeyTypeAlias] = parent if not isinstance(parent, Key) else None
+        self._folded_path = None
 
     @property
     def name(self) -> str:
@@ -214,18 +234,27 @@ class Key:
         state = "open" if self.is_open() else "closed"
         return f"Key<{handle_to_str(h)}:{n!r} {state}>"
 
+    def _folded_canonical_path(self) -> str:
+        """Returns the casefolded canonical path, used for comparison and hashing.
+
+        A key's path never changes after construction, so it is computed once.
+        """
+        if self._folded_path is None:
+            self._folded_path = self.canonical_path().casefold()
+        return self._folded_path
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Key):
             return NotImplemented
-        return self.canonical_path().casefold() == other.canonical_path().casefold()
+        return self._folded_canonical_path() == other._folded_canonical_path()
 
     def __lt__(self, other: object) -> bool:
         if not isinstance(other, Key):
             return NotImplemented
-        return self.canonical_path().casefold() < other.canonical_path().casefold()
+        return self._folded_canonical_path() < other._folded_canonical_path()
 
     def __hash__(self) -> int:
-        return hash(self.canonical_path().casefold())
+        return hash(self._folded_canonical_path())
 
     def open_handle(
         self,
@@ -380,37 +409,37 @@ class Key:
 
     # iterating over the key/value pairs (items) in the key, similar to a dict.
 
-    def items_typed(self) -> Iterator[tuple[str, tuple[Any, int]]]:
-        """Iterates over the values in the key, returning (name, (value, type)) tuples."""
+    def _enum_values(self) -> Iterator[tuple[str, Any, int]]:
+        """Enumerates the raw (name, value, type) tuples of the key.  Used internally."""
         assert self._handle is not None
         i = 0
         while True:
             try:
-                name, value, type = winreg.EnumValue(self._handle, i)
-                yield (name, (value, type))
-                i += 1
+                item = winreg.EnumValue(self._handle, i)
             except OSError:
                 break
+            yield item
+            i += 1
+
+    def items_typed(self) -> Iterator[tuple[str, tuple[Any, int]]]:
+        """Iterates over the values in the key, returning (name, (value, type)) tuples."""
+        return ((name, (value, value_type)) for name, value, value_type in self._enum_values())
 
     def items(self) -> Iterator[tuple[str, Any]]:
         """Iterates over the values in the key, returning (name, value) typles"""
-        for name, (value, _) in self.items_typed():
-            yield (name, value)
+        return ((name, value) for name, value, _ in self._enum_values())
 
     def keys(self) -> Iterator[str]:
         """iterates of the item names in the key"""
-        for itemname, _ in self.items_typed():
-            yield itemname
+        return (name for name, _, _ in self._enum_values())
 
     def values(self) -> Iterator[Any]:
         """iterates of the item values in the key"""
-        for _, (value, _) in self.items_typed():
-            yield value
+        return (value for _, value, _ in self._enum_values())
 
     def values_typed(self) -> Iterator[tuple[Any, int]]:
         """iterates of the item values in the key, returning (value, type) tuples."""
-        for _, value in self.items_typed():
-            yield value
+        return ((value, value_type) for _, value, value_type in self._enum_values())
 
     def subkeys(self) -> Iterator[Key]:
         """Iterates over the subkeys in the key"""
@@ -501,6 +530,33 @@ class Key:
         except KeyError:
             return default
 
+    def get_many(self, names: Iterable[str], /) -> dict[str, Any]:
+        """Gets several values from the key, returning a dict of name to value.
+
+        Values are read as for dict-style access (`key[name]`), so a missing
+        name raises `KeyError`.
+        """
+        assert self._handle is not None
+        return {name: self[name] for name in names}
+
+    def update(self, values: Mapping[str, Any] | Key | Iterable[tuple[str, Any]] = (), /) -> None:
+        """Sets several values in the key, similar to `dict.update`.
+
+        As with `dict.update`, an argument with a `keys()` method (a mapping or
+        another open `Key`) is read by name; anything else is taken as
+        `(name, value)` pairs. Values are converted as for dict-style
+        assignment (`key[name] = value`), so `(value, type)` tuples set an
+        explicit registry type.
+        """
+        assert self._handle is not None
+        if hasattr(values, "keys"):
+            source = cast(Mapping[str, Any], values)
+            for name in source.keys():
+                self[name] = source[name]
+        else:
+            for name, value in values:
+                self[name] = value
+
     def __getitem__(self, name: str) -> Any:
         """Get a value from the key"""
         assert self._handle is not None
@@ -535,6 +591,33 @@ class Key:
         except FileNotFoundError as e:
             raise KeyError(name) from e
 
+    def __contains__(self, name: object) -> bool:
+        """Checks if the key has a value with the given name"""
+        assert self._handle is not None
+        if name is None:
+            name = ""
+        elif not isinstance(name, str):
+            return False
+        try:
+            winreg.QueryValueEx(self._handle, name)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterates over the value names in the key, like `keys()`"""
+        return self.keys()
+
+    def __len__(self) -> int:
+        """Returns the number of values in the key, without enumerating them."""
+        assert self._handle is not None
+        _, num_values, _ = winreg.QueryInfoKey(self._handle)
+        return num_values
+
+    def __bool__(self) -> bool:
+        """Keys are always truthy, regardless of how many values they hold."""
+        return True
+
     def __enter__(self) -> Key:
         """Enter context manager.  Raises RuntimeError if the key is not open"""
         if not self.is_open():
@@ -551,8 +634,8 @@ class Key:
         if missing_ok and not self.exists():
             return
         if tree:
-            with self.open():
-                for subkey in list(self.subkeys()):
+            with self.open() as key:
+                for subkey in list(key.subkeys()):
                     subkey.delete(tree=True)
         h, n = self._hkey_name()
         winreg.DeleteKey(h, n)
@@ -1,3 +1,4 @@
+import importlib
 import sys
 import uuid
 from pathlib import Path
@@ -12,6 +13,19 @@ SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
+# the registry module imports winreg at load time; import it once here (against
+# the fake backend off Windows) so fixtures and test modules can bind `Key` at
+# module scope. patch_winreg installs the default backend for the session; the
+# sandbox fixtures select a backend per test.
+if sys.platform != "win32":
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(sys.modules, "winreg", fakewinreg)
+        registry_module = importlib.import_module("src.regkit.registry")
+else:
+    registry_module = importlib.import_module("src.regkit.registry")
+
+Key = registry_module.Key
+
 
 def pytest_addoption(parser: pytest.Parser) -> None:
     parser.addoption(
@@ -30,20 +44,21 @@ def pytest_addoption(parser: pytest.Parser) -> None:
 
 def _patch_backend(monkeypatch: pytest.MonkeyPatch, backend) -> None:
     monkeypatch.setitem(sys.modules, "winreg", backend)
-
-    import src.regkit.registry as registry_module
-
     monkeypatch.setattr(registry_module, "winreg", backend)
 
 
-@pytest.fixture(autouse=True)
-def patch_winreg(monkeypatch: pytest.MonkeyPatch) -> None:
+@pytest.fixture(scope="session", autouse=True)
+def patch_winreg():
+    # patch once for the whole run; the per-backend sandbox fixtures layer
+    # their own function-scoped patches on top of this default
     if sys.platform == "win32":
         import winreg as backend
     else:
         backend = fakewinreg
 
-    _patch_backend(monkeypatch, backend)
+    with pytest.MonkeyPatch.context() as mp:
+        _patch_backend(mp, backend)
+        yield
 
 
 @pytest.fixture
@@ -60,6 +75,12 @@ def require_real_winreg(request: pytest.FixtureRequest) -> None:
         pytest.skip("Requires real winreg backend; run without --disable-real-backend")
 
 
+@pytest.fixture(scope="session")
+def hkcu_root():
+    """Shared HKEY_CURRENT_USER root key; root keys wrap a predefined handle and are never closed."""
+    return Key.current_user()
+
+
 def _delete_subtree(key) -> None:
     try:
         with key.open(write=True) as opened:
@@ -80,18 +101,18 @@ def fake_user_key(monkeypatch: pytest.MonkeyPatch, request: pytest.FixtureReques
 
     _patch_backend(monkeypatch, fakewinreg)
 
-    from src.regkit.registry import Key
-
     suffix = uuid.uuid4().hex
     relative_parts = ("Software", "regkit-tests", suffix)
 
+    # restoring a snapshot is cheaper than walking and deleting the subtree
+    state = fakewinreg.snapshot()
     with Key.current_user().create(*relative_parts):
         pass
 
     try:
         yield Key.current_user().subkey(*relative_parts)
     finally:
-        _delete_subtree(Key.current_user().subkey(*relative_parts))
+        fakewinreg.load_snapshot(state)
 
 
 @pytest.fixture
@@ -105,8 +126,6 @@ def real_user_key(monkeypatch: pytest.MonkeyPatch, request: pytest.FixtureReques
 
     _patch_backend(monkeypatch, real_winreg)
 
-    from src.regkit.registry import Key
-
     suffix = uuid.uuid4().hex
     relative_parts = ("Software", "regkit-tests", suffix)
 
@@ -123,3 +142,15 @@ def real_user_key(monkeypatch: pytest.MonkeyPatch, request: pytest.FixtureReques
 def sandbox_key(request: pytest.FixtureRequest):
     fixture_name = request.param
     return request.getfixturevalue(fixture_name)
+
+
+@pytest.fixture
+def sandbox_rel(sandbox_key):
+    """Sandbox key path parts below the root token."""
+    return sandbox_key.parts[1:]
+
+
+@pytest.fixture
+def sandbox_rel_path(sandbox_rel):
+    """Sandbox key path below the root, joined with backslashes."""
+    return "\\".join(sandbox_rel)
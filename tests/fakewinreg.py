@@ -1,10 +1,11 @@
 # This file contains a fake implementation of the winreg module for testing purposes.
 # It simulates the behavior of the Windows Registry for unit tests.
 
+import pickle
 import time
 from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Any, Final, TypeAlias
+from typing import Any, Callable, Final, TypeAlias
 
 # difference between Windows epoch (1601-01-01) and Unix epoch (1970-01-01)
 # in nanoseconds: 11644473600 seconds
@@ -23,6 +24,23 @@ def filetime_to_time_ns(filetime: int) -> int:
     return filetime * 100 - _WINDOWS_EPOCH_DIFF_NS
 
 
+# clock consulted for key timestamps; tests may replace it to control time
+_clock: Callable[[], int] = time.time_ns
+
+# last timestamp handed out to a key; successive mutations are strictly ordered
+_last_stamp_ns: int = 0
+
+
+def next_stamp_ns() -> int:
+    """Return the current time in nanoseconds, advanced past the previous
+    stamp by at least one FILETIME tick (100 ns) so that every mutation is
+    observable through QueryInfoKey without waiting on the wall clock.
+    """
+    global _last_stamp_ns
+    _last_stamp_ns = max(_clock(), _last_stamp_ns + 100)
+    return _last_stamp_ns
+
+
 HKEY_CLASSES_ROOT: int = 2147483648
 HKEY_CURRENT_USER: int = 2147483649
 HKEY_LOCAL_MACHINE: int = 2147483650
@@ -129,23 +147,34 @@ class KeyEntry:
 
     values: dict[str, tuple[int, Any]] = field(default_factory=dict)
     # store the creation time in nanoseconds for precise conversion later
-    last_modified: int = field(default_factory=lambda: time.time_ns())
+    last_modified: int = field(default_factory=next_stamp_ns)
+    # value names in enumeration order, rebuilt lazily after a name is added or removed
+    _value_names: list[str] | None = field(default=None, repr=False, compare=False)
 
     def set_value(self, name: str, val_type: int, value: Any) -> None:
         # store default value under empty string
+        if name not in self.values:
+            self._value_names = None
         self.values[name] = (val_type, value)
         self.touch()
 
     def delete_value(self, name: str) -> bool:
         if name in self.values:
             del self.values[name]
+            self._value_names = None
             self.touch()
             return True
         return False
 
+    def value_names(self) -> list[str]:
+        """Return the value names in enumeration order, default value last."""
+        if self._value_names is None:
+            self._value_names = sorted(self.values, key=lambda x: (x == "", x))
+        return self._value_names
+
     def touch(self) -> None:
         """Update the last_modified timestamp to the current time."""
-        self.last_modified = time.time_ns()
+        self.last_modified = next_stamp_ns()
 
 
 class FakeWinReg:
@@ -159,7 +188,17 @@ class FakeWinReg:
         self.registry: dict[str, KeyEntry] = defaultdict(KeyEntry)
 
     def reset(self) -> None:
-        self.registry.clear()
+        # swap in a new dict rather than clearing entries one by one; all
+        # lookups go through self.registry so the rebind is seen everywhere
+        self.registry = defaultdict(KeyEntry)
+
+    def snapshot(self) -> bytes:
+        """Return an opaque copy of the registry contents, for load_snapshot()."""
+        return pickle.dumps(dict(self.registry))
+
+    def load_snapshot(self, state: bytes) -> None:
+        """Replace the registry contents with a copy taken by snapshot()."""
+        self.registry = defaultdict(KeyEntry, pickle.loads(state))
 
     def create_key(self, key: str) -> dict[str, tuple[int, Any]]:
         # split the key into parts and ensure each part exists
@@ -322,8 +361,10 @@ class FakeWinReg:
 
     def QueryInfoKey(self, key: _KeyType) -> tuple[int, int, int]:
         self.check_key(key, KEY_QUERY_VALUE | KEY_ENUMERATE_SUB_KEYS)
-        subkeys = self.get_subkeys(key.name)
-        entry = self.get_entry(key.name)
+        # resolve the base name: HKEYType has .name, int roots need mapping
+        base_name = key.name if isinstance(key, HKEYType) else self.create_name(key, None)
+        subkeys = self.get_subkeys(base_name)
+        entry = self.get_entry(base_name)
         values = entry.values
         num_subkeys = len(subkeys)
         num_values = len(values) if values is not None else 0
@@ -348,6 +389,8 @@ class FakeWinReg:
     def DeleteKeyEx(self, key: _KeyType, sub_key: str, access=KEY_WOW64_64KEY, reserved: int = 0) -> None:
         self.check_key(key)
         full_key_name = self.create_name(key, sub_key)
+        if not self.has_entry(full_key_name):
+            raise FileNotFoundError("The system cannot find the file specified.")
         if self.has_children(full_key_name):
             raise PermissionError("The system cannot delete a key that has subkeys.")
         self.delete_key(full_key_name)
@@ -369,11 +412,10 @@ class FakeWinReg:
         self.check_key(key)
         if isinstance(key, HKEYType):
             key.check_access(KEY_QUERY_VALUE)
-        values = self.get_entry(key.name).values
-        value_names = sorted(values.keys(), key=lambda x: (x == "", x))
+        entry = self.get_entry(key.name)
         try:
-            name = value_names[index]
-            t, v = values[name]
+            name = entry.value_names()[index]
+            t, v = entry.values[name]
             return (name if name != "" else "", v, t)
         except IndexError:
             raise OSError("The system cannot find the file specified.") from None
@@ -383,7 +425,15 @@ FakeWinRegInstance = FakeWinReg()
 
 
 def reset():
-    FakeWinRegInstance.registry.clear()
+    FakeWinRegInstance.reset()
+
+
+def snapshot() -> bytes:
+    return FakeWinRegInstance.snapshot()
+
+
+def load_snapshot(state: bytes) -> None:
+    FakeWinRegInstance.load_snapshot(state)
 
 
 apis = [
@@ -13,8 +13,8 @@ except ImportError:
 USERKEY = r"Software\FakeTest"
 
 
-# a test fixture to provide a fresh fake registry for each test
-@pytest.fixture(autouse=True)
+# a fresh fake registry per module; tests are isolated by their own subkey
+@pytest.fixture(scope="module", autouse=True)
 def fresh_registry():
     fake.reset()
     try:
@@ -24,26 +24,33 @@ def fresh_registry():
 
 
 @pytest.fixture
-def fake_module_and_key():
-    key = fake.CreateKeyEx(fake.HKEY_CURRENT_USER, USERKEY, 0, fake.KEY_ALL_ACCESS)
+def userkey(request):
+    """Per-test key path under USERKEY, so tests don't need a registry reset."""
+    return f"{USERKEY}\\{request.node.name}"
+
+
+@pytest.fixture
+def fake_module_and_key(userkey):
+    key = fake.CreateKeyEx(fake.HKEY_CURRENT_USER, userkey, 0, fake.KEY_ALL_ACCESS)
     try:
         yield fake, key
     finally:
         delete_tree(fake, key)
         key.Close()
-        fake.reset()
+        delete_key(fake, userkey)
 
 
 @pytest.fixture
-def real_module_and_key():
+def real_module_and_key(userkey):
     if winreg is None:
         pytest.skip("winreg not available on this platform")
-    k = winreg.CreateKeyEx(winreg.HKEY_CURRENT_USER, USERKEY, 0, winreg.KEY_ALL_ACCESS)
+    k = winreg.CreateKeyEx(winreg.HKEY_CURRENT_USER, userkey, 0, winreg.KEY_ALL_ACCESS)
     try:
         yield winreg, k
     finally:
         delete_tree(winreg, k)
         k.Close()
+        delete_key(winreg, userkey)
 
 
 @pytest.fixture(params=["fake", "real"] if winreg else ["fake"])
@@ -76,6 +83,14 @@ def delete_tree(module, key):
         pass  # no more values
 
 
+def delete_key(module, userkey):
+    """Delete the (emptied) per-test key itself."""
+    try:
+        module.DeleteKey(module.HKEY_CURRENT_USER, userkey)
+    except OSError:
+        pass  # already gone
+
+
 EXPECTED_CONSTANT_PREFIX = "HKEY_"
 EXPECTED_FUNCTIONS = {
     "CreateKey",
@@ -401,7 +416,7 @@ def test_enum_on_empty_key_raises(module_and_key):
             pass
 
 
-def test_fake_reset_idempotent(fake_module_and_key):
+def test_fake_reset_idempotent(fake_module_and_key, userkey):
     fake_mod, k = fake_module_and_key
     # set some values and subkeys
     fake_mod.CreateKeyEx(k, "R1", 0, fake_mod.KEY_ALL_ACCESS)
@@ -410,7 +425,7 @@ def test_fake_reset_idempotent(fake_module_and_key):
     fake.reset()
     fake.reset()
     # after reset the registry should be empty; creating the top-level key again should be fine
-    n = fake.CreateKeyEx(fake.HKEY_CURRENT_USER, USERKEY, 0, fake.KEY_ALL_ACCESS)
+    n = fake.CreateKeyEx(fake.HKEY_CURRENT_USER, userkey, 0, fake.KEY_ALL_ACCESS)
     try:
         fake.SetValueEx(n, "after", 0, fake.REG_SZ, "ok")
     finally:
@@ -420,6 +435,21 @@ def test_fake_reset_idempotent(fake_module_and_key):
             pass
 
 
+def test_fake_snapshot_roundtrip(fake_module_and_key):
+    fake_mod, k = fake_module_and_key
+    fake_mod.SetValueEx(k, "kept", 0, fake_mod.REG_SZ, "before")
+    state = fake.snapshot()
+
+    # changes after the snapshot are discarded by load_snapshot
+    fake_mod.SetValueEx(k, "kept", 0, fake_mod.REG_SZ, "after")
+    fake_mod.CreateKeyEx(k, "Dropped", 0, fake_mod.KEY_ALL_ACCESS)
+    fake.load_snapshot(state)
+
+    assert fake_mod.QueryValueEx(k, "kept") == ("before", fake_mod.REG_SZ)
+    with pytest.raises(OSError):
+        fake_mod.EnumKey(k, 0)
+
+
 def test_check_key_closed_and_invalid(module_and_key):
     """Ensure operations on a closed handle and on an invalid numeric key
     raise the expected errors. The fake implementation uses OSError for
@@ -547,9 +577,9 @@ def test_query_info_key_timestamp_updates(fake_module_and_key):
 
 def test_parent_timestamp_on_subkey_create_delete(module_and_key):
     """Check whether creating/deleting a direct subkey updates the parent's
-    QueryInfoKey last-modified timestamp. The fake backend does not update
-    parent timestamps on subkey creation/deletion; real Windows `winreg` tends
-    to update them. We assert the observed behavior per-backend.
+    QueryInfoKey last-modified timestamp. The fake backend advances the parent
+    timestamp by at least one tick on every mutation; real Windows `winreg`
+    tends to update them too, but only with wall-clock resolution.
     """
     module, h = module_and_key
 
@@ -558,7 +588,8 @@ def test_parent_timestamp_on_subkey_create_delete(module_and_key):
     # create a direct subkey
     sub = module.CreateKeyEx(h, "ParentTSChild", access=module.KEY_ALL_ACCESS)
     # slight sleep to avoid tight timestamp races on fast CI/machines
-    time.sleep(0.001)
+    if module is winreg:
+        time.sleep(0.001)
     try:
         nsub1, nval1, ft1 = module.QueryInfoKey(h)
     finally:
@@ -569,7 +600,8 @@ def test_parent_timestamp_on_subkey_create_delete(module_and_key):
 
     # delete the subkey
     # ensure a tiny delay so the deletion produces a later timestamp
-    time.sleep(0.001)
+    if module is winreg:
+        time.sleep(0.001)
     try:
         module.DeleteKey(h, "ParentTSChild")
     except Exception:
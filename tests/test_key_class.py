@@ -1,10 +1,17 @@
 import sys
 import time
+from collections import deque
+from functools import partial
 
 import pytest
+import src.regkit.registry as registry_module
+from src.regkit.registry import Key
 
 from tests import fakewinreg as fake
 
+_EXPECTED_ORDER = ("Alpha", "beta", "Gamma")
+_EXPECTED_WALK_TOP_SUBS = frozenset({"A", "B"})
+
 
 def test_key_basic_operations(sandbox_key):
     root = sandbox_key
@@ -17,9 +24,11 @@ def test_key_basic_operations(sandbox_key):
         assert k["alpha"] == "A"
         assert k.get("gamma", "X") == "X"
 
-        # ensure items enumerates
-        items = dict(k.items())
-        assert "alpha" in items and "beta" in items
+        # membership and iteration work on the key directly
+        assert "alpha" in k and "beta" in k
+        assert "gamma" not in k
+        assert 42 not in k
+        assert set(k) == {"alpha", "beta"}
 
     # reopen and read values
     with root.open("UnitTest") as k2:
@@ -33,9 +42,6 @@ def test_key_basic_operations(sandbox_key):
         with pytest.raises(KeyError):
             _ = k3["alpha"]
 
-    sub = root.subkey("UnitTest")
-    assert sub.exists()
-
 
 def test_parametrized_open_create_write_roundtrip(sandbox_key):
     leaf = sandbox_key.subkey("Roundtrip")
@@ -56,16 +62,12 @@ def test_parametrized_open_create_write_roundtrip(sandbox_key):
 
 def test_parametrized_value_iteration_and_get(sandbox_key):
     with sandbox_key.create("Values") as key:
-        key["name"] = "regkit"
-        key["enabled"] = 1
+        key.update({"name": "regkit", "enabled": 1})
 
     with sandbox_key.open("Values") as key:
         assert key.get("missing", "fallback") == "fallback"
-        items = dict(key.items())
-        assert items["name"] == "regkit"
-        assert items["enabled"] == 1
-        assert set(key.keys()) == set(items.keys())
-        assert set(key.values()) == set(items.values())
+        assert dict(key.items()) == {"name": "regkit", "enabled": 1}
+        assert key.get_many(["name", "enabled"]) == {"name": "regkit", "enabled": 1}
 
 
 def test_subkeys_and_enum(sandbox_key):
@@ -80,11 +82,9 @@ def test_subkeys_and_enum(sandbox_key):
 
     # enumerate subkeys from the sandbox root
     with root.open() as r:
-        names = {s.name for s in r.subkeys()}
-        assert "A" in names
+        assert any(s.name == "A" for s in r.subkeys())
 
-    sub = root.subkey("A")
-    assert sub.exists()
+    assert root.subkey("A").exists()
 
 
 def test_iterdir_alias_matches_subkeys(sandbox_key):
@@ -96,27 +96,44 @@ def test_iterdir_alias_matches_subkeys(sandbox_key):
         pass
 
     with root.open() as key:
-        subkeys_names = {sub.name for sub in key.subkeys()}
-        iterdir_names = {sub.name for sub in key.iterdir()}
+        subkeys_names = sorted(sub.name for sub in key.subkeys())
+        iterdir_names = sorted(sub.name for sub in key.iterdir())
 
     assert iterdir_names == subkeys_names
 
 
-def test_query_info_key_timestamps(sandbox_key):
-    import src.regkit.registry as registry_module
+def test_query_info_key_timestamp_advances_on_write_fake(fake_user_key, monkeypatch):
+    # the fake backend stamps every write strictly after the previous one, so a
+    # single write must advance the key's last-write FILETIME even if the clock
+    # does not tick at all.
+    monkeypatch.setattr(fake, "_clock", lambda: 0)
+
+    with fake_user_key.create("TS") as key:
+        _, _, ft0 = fake.QueryInfoKey(key.handle)
+        key["tsv"] = "v"
+        _, _, ft1 = fake.QueryInfoKey(key.handle)
+
+    assert ft1 > ft0
 
-    with sandbox_key.create("TS") as key:
+
+def test_query_info_key_timestamps_real(real_user_key):
+    with real_user_key.create("TS") as key:
         # Integration check: modifying values through Key should be reflected
         # in the backend's key last-write timestamp (QueryInfoKey FILETIME).
-        _, _, ft0 = registry_module.winreg.QueryInfoKey(key.handle)
+        query_info_key = registry_module.winreg.QueryInfoKey
+        _, _, ft0 = query_info_key(key.handle)
 
+        # the real registry usually advances on the first write; if the clock
+        # has not ticked yet, back off exponentially (about 0.2s in total).
         ft1 = ft0
-        for _ in range(10):
-            time.sleep(0.01)
+        delay = 5e-5
+        for _ in range(12):
             key["tsv"] = "v"
-            _, _, ft1 = registry_module.winreg.QueryInfoKey(key.handle)
+            _, _, ft1 = query_info_key(key.handle)
             if ft1 > ft0:
                 break
+            time.sleep(delay)
+            delay *= 2
 
         assert ft1 > ft0
 
@@ -134,24 +151,28 @@ def test_handle_property_requires_open_key(sandbox_key):
         _ = leaf.handle
 
 
-def test_parent_for_root_is_none():
-    from src.regkit.registry import Key
+def test_parent_for_root_is_none(hkcu_root):
+    assert hkcu_root.parent is None
+
 
+def test_root_factory_reuses_root_key():
     root = Key.current_user()
-    assert root.parent is None
+    assert Key.current_user() is root
+    assert Key.current_user("Software").parent == root
+    assert root.is_open()
 
 
-def test_parents_for_root_is_empty_tuple():
-    from src.regkit.registry import Key
+def test_parents_for_root_is_empty_tuple(hkcu_root):
+    assert hkcu_root.parents() == ()
 
-    root = Key.current_user()
-    assert root.parents() == ()
 
+@pytest.fixture
+def nested_parent_child_leaf(sandbox_key):
+    return sandbox_key.subkey("Parent", "Child", "Leaf")
 
-def test_parent_for_nested_key_returns_lexical_parent(sandbox_key):
-    key = sandbox_key.subkey("Parent", "Child", "Leaf")
 
-    parent = key.parent
+def test_parent_for_nested_key_returns_lexical_parent(nested_parent_child_leaf):
+    parent = nested_parent_child_leaf.parent
     assert parent is not None
     assert parent.name == "Child"
     assert parent.parts[-2:] == ("Parent", "Child")
@@ -161,10 +182,8 @@ def test_parent_for_nested_key_returns_lexical_parent(sandbox_key):
     assert grandparent.name == "Parent"
 
 
-def test_parents_for_nested_key_returns_ordered_ancestors(sandbox_key):
-    key = sandbox_key.subkey("Parent", "Child", "Leaf")
-
-    ancestors = key.parents()
+def test_parents_for_nested_key_returns_ordered_ancestors(sandbox_key, nested_parent_child_leaf):
+    ancestors = nested_parent_child_leaf.parents()
 
     assert len(ancestors) >= 3
     assert ancestors[0].name == "Child"
@@ -179,33 +198,28 @@ def test_key_ordering_is_case_insensitive_by_path(sandbox_key):
     key_b = sandbox_key.subkey("ordering", "beta")
     key_c = sandbox_key.subkey("ORDERING", "Gamma")
 
-    sorted_names = [key.name for key in sorted([key_c, key_b, key_a])]
-    assert sorted_names == ["Alpha", "beta", "Gamma"]
+    sorted_names = tuple(key.name for key in sorted([key_c, key_b, key_a]))
+    assert sorted_names == _EXPECTED_ORDER
 
 
 def test_key_equality_is_case_insensitive_by_path(sandbox_key):
-    key_upper = sandbox_key.subkey("CASE", "Path")
-    key_lower = sandbox_key.subkey("case", "path")
+    parts = sandbox_key.parts
+    key_upper = Key.from_parts((*parts, "CASE", "Path"))
+    key_lower = Key.from_parts((*parts, "case", "path"))
 
     assert key_upper == key_lower
 
 
-def test_key_equality_and_hash_are_root_alias_insensitive(sandbox_key):
-    from src.regkit.registry import Key
-
-    rel_parts = sandbox_key.parts[1:]
-    key_alias = Key.from_parts(("HKCU", *rel_parts, "AliasEq"))
-    key_full = Key.from_parts(("HKEY_CURRENT_USER", *rel_parts, "aliaseq"))
+def test_key_equality_and_hash_are_root_alias_insensitive(sandbox_rel):
+    key_alias = Key.from_parts(("HKCU", *sandbox_rel, "AliasEq"))
+    key_full = Key.from_parts(("HKEY_CURRENT_USER", *sandbox_rel, "aliaseq"))
 
     assert key_alias == key_full
     assert hash(key_alias) == hash(key_full)
 
 
-def test_canonical_path_and_parts_use_canonical_root_alias(sandbox_key):
-    from src.regkit.registry import Key
-
-    rel_parts = sandbox_key.parts[1:]
-    key = Key.from_parts(("HKCU", *rel_parts, "Canon"))
+def test_canonical_path_and_parts_use_canonical_root_alias(sandbox_rel):
+    key = Key.from_parts(("HKCU", *sandbox_rel, "Canon"))
 
     canonical_parts = key.canonical_parts()
     assert canonical_parts[0] == "HKEY_CURRENT_USER"
@@ -214,8 +228,6 @@ def test_canonical_path_and_parts_use_canonical_root_alias(sandbox_key):
 
 
 def test_canonical_path_for_raw_handle_ignores_first_label():
-    from src.regkit.registry import Key
-
     key_foo = Key(100, "foo")
     key_bar = Key(100, "bar")
 
@@ -226,8 +238,6 @@ def test_canonical_path_for_raw_handle_ignores_first_label():
 
 
 def test_parts_include_root_and_subkeys(sandbox_key):
-    from src.regkit.registry import Key
-
     key = sandbox_key.subkey("Parts", "Leaf")
 
     parts = key.parts
@@ -239,95 +249,66 @@ def test_parts_include_root_and_subkeys(sandbox_key):
     assert rebuilt.name == "Leaf"
 
 
-def test_parts_for_root_only_contains_root_token():
-    from src.regkit.registry import Key
-
-    root = Key.current_user()
-    assert root.parts == ("HKEY_CURRENT_USER",)
+def test_parts_for_root_only_contains_root_token(hkcu_root):
+    assert hkcu_root.parts == ("HKEY_CURRENT_USER",)
 
 
 def test_from_parts_accepts_alias_and_roundtrips():
-    from src.regkit.registry import Key
-
     key = Key.from_parts(("HKCU", "Software", "regkit-tests"))
     assert key.parts == ("HKCU", "Software", "regkit-tests")
 
 
-def test_from_parts_invalid_input_raises_value_error():
-    from src.regkit.registry import Key
-
-    with pytest.raises(ValueError):
-        Key.from_parts(())
-
-    with pytest.raises(ValueError):
-        Key.from_parts(("", "Software"))
-
+@pytest.mark.parametrize(
+    "bad",
+    [(), ("", "Software"), ("NOT_A_ROOT", "Software")],
+    ids=["empty", "empty_root", "unknown_root"],
+)
+def test_from_parts_invalid_input_raises_value_error(bad):
     with pytest.raises(ValueError):
-        Key.from_parts(("NOT_A_ROOT", "Software"))
+        Key.from_parts(bad)
 
 
-def test_from_path_with_full_root_name(sandbox_key):
-    from src.regkit.registry import Key
-
+def test_from_path_with_full_root_name(sandbox_key, sandbox_rel_path):
     with sandbox_key.create("FromPath", "Full") as key:
         key["value"] = "ok"
 
-    sandbox_relative_path = "\\".join(sandbox_key.parts[1:])
-    key_from_path = Key.from_path(f"HKEY_CURRENT_USER\\{sandbox_relative_path}\\FromPath\\Full")
+    key_from_path = Key.from_path(f"HKEY_CURRENT_USER\\{sandbox_rel_path}\\FromPath\\Full")
     with key_from_path.open() as key:
         assert key["value"] == "ok"
 
 
-def test_from_path_with_root_alias(sandbox_key):
-    from src.regkit.registry import Key
-
+def test_from_path_with_root_alias(sandbox_key, sandbox_rel_path):
     with sandbox_key.create("FromPath", "Alias") as key:
         key["value"] = "ok"
 
-    sandbox_relative_path = "\\".join(sandbox_key.parts[1:])
-    key_from_path = Key.from_path(f"HKCU\\{sandbox_relative_path}\\FromPath\\Alias")
+    key_from_path = Key.from_path(f"HKCU\\{sandbox_rel_path}\\FromPath\\Alias")
     with key_from_path.open() as key:
         assert key["value"] == "ok"
 
 
 def test_from_path_root_only_returns_open_root():
-    from src.regkit.registry import Key
-
     root = Key.from_path("HKCU")
     assert root.is_open()
     assert root.is_root()
 
 
-def test_from_path_invalid_paths_raise_value_error():
-    from src.regkit.registry import Key
-
-    with pytest.raises(ValueError):
-        Key.from_path("")
-
-    with pytest.raises(ValueError):
-        Key.from_path("   ")
-
+@pytest.mark.parametrize("bad", ["", "   ", "NOT_A_ROOT\\Software"], ids=["empty", "blank", "unknown_root"])
+def test_from_path_invalid_paths_raise_value_error(bad):
     with pytest.raises(ValueError):
-        Key.from_path("NOT_A_ROOT\\Software")
+        Key.from_path(bad)
 
 
 def test_key_int_parent_with_name_is_opened_and_named():
-    import src.regkit.registry as registry_module
-
-    key = registry_module.Key(registry_module.winreg.HKEY_CURRENT_USER, "Software")
+    key = Key(registry_module.winreg.HKEY_CURRENT_USER, "Software")
     assert key.is_open()
     assert key.name == "Software"
 
 
-def test_is_hive_true_for_predefined_root():
-    from src.regkit.registry import Key
-
-    assert Key.current_user().is_hive()
+def test_is_hive_true_for_predefined_root(hkcu_root):
+    assert hkcu_root.is_hive()
 
 
 def test_is_hive_false_for_non_hive_int_handle():
-    from src.regkit.registry import Key
-
     assert not Key(100, "Software").is_hive()
 
 
@@ -336,37 +317,27 @@ def test_is_hive_false_for_non_root_key(sandbox_key):
     assert not child.is_hive()
 
 
-def test_subkey_traversal_with_subkey_chain(sandbox_key):
-    root = sandbox_key
-
-    with root.create("Traversal", "Level1", "Level2") as key:
-        key["marker"] = "ok"
-
-    via_subkey = root.subkey("Traversal").subkey("Level1").subkey("Level2")
-    with via_subkey.open() as key:
-        assert key["marker"] == "ok"
-
-
-def test_subkey_traversal_with_open_extra_args(sandbox_key):
-    root = sandbox_key
-
-    with root.create("Traversal", "Level1", "Level2") as key:
-        key["marker"] = "ok"
-
-    with root.open("Traversal", "Level1", "Level2") as key:
-        assert key["marker"] == "ok"
-
-
-def test_subkey_traversal_with_backslash_paths(sandbox_key):
-    root = sandbox_key
-
-    with root.create("Traversal", "Level1", "Level2") as key:
+@pytest.fixture
+def traversal_tree(sandbox_key):
+    """The sandbox, with a `marker` value on the Traversal/Level1/Level2 key."""
+    with sandbox_key.create("Traversal", "Level1", "Level2") as key:
         key["marker"] = "ok"
-
-    with root.open(r"Traversal\Level1\Level2") as key:
-        assert key["marker"] == "ok"
-
-    with root.open("Traversal", r"Level1\Level2") as key:
+    return sandbox_key
+
+
+@pytest.mark.parametrize(
+    "navigate",
+    [
+        lambda root: root.subkey("Traversal").subkey("Level1").subkey("Level2").open(),
+        lambda root: root.subkey(r"Traversal\Level1\Level2").open(),
+        lambda root: root.open("Traversal", "Level1", "Level2"),
+        lambda root: root.open(r"Traversal\Level1\Level2"),
+        lambda root: root.open("Traversal", r"Level1\Level2"),
+    ],
+    ids=["subkey_chain", "subkey_path", "extra_args", "backslash_path", "mixed"],
+)
+def test_subkey_traversal(traversal_tree, navigate):
+    with navigate(traversal_tree) as key:
         assert key["marker"] == "ok"
 
 
@@ -402,11 +373,10 @@ def test_walk_topdown_yields_root_first_with_expected_names(sandbox_key):
     with root.create("B"):
         pass
 
-    walked = list(root.walk(topdown=True))
-    first_key, first_subkeys, first_values = walked[0]
+    first_key, first_subkeys, first_values = next(root.walk(topdown=True))
 
     assert first_key.name == root.name
-    assert set(first_subkeys) == {"A", "B"}
+    assert set(first_subkeys) == _EXPECTED_WALK_TOP_SUBS
     assert set(first_values) == {"root_val"}
 
 
@@ -420,9 +390,9 @@ def test_walk_topdown_pruning_skips_branch(sandbox_key):
     with root.create("Skip", "Leaf"):
         pass
 
-    visited = []
+    visited = set()
     for key, subkey_names, _ in root.walk(topdown=True):
-        visited.append(key.name)
+        visited.add(key.name)
         if key.name == root.name:
             subkey_names[:] = [name for name in subkey_names if name != "Skip"]
 
@@ -439,8 +409,9 @@ def test_walk_bottomup_yields_parent_last(sandbox_key):
     with root.create("Child", "Grandchild"):
         pass
 
-    walked = list(root.walk(topdown=False))
-    assert walked[-1][0].name == root.name
+    # keep only the last item instead of buffering the whole walk
+    last_key, _, _ = deque(root.walk(topdown=False), maxlen=1).pop()
+    assert last_key.name == root.name
 
 
 def test_walk_max_depth_zero_yields_only_root(sandbox_key):
@@ -474,60 +445,49 @@ def test_walk_negative_max_depth_raises_valueerror(sandbox_key):
         root.walk(max_depth=-1)
 
 
-def test_open_missing_key_raises_keyerror(sandbox_key):
-    root = sandbox_key
-    key_ref = root.subkey("OpenFlags", "Case")
+@pytest.fixture
+def openflags_ref(sandbox_key):
+    return sandbox_key.subkey("OpenFlags", "Case")
 
-    with pytest.raises(KeyError):
-        key_ref.open()
 
+def test_open_missing_key_raises_keyerror(openflags_ref):
+    with pytest.raises(KeyError):
+        openflags_ref.open()
 
-def test_open_create_true_creates_key(sandbox_key):
-    root = sandbox_key
-    key_ref = root.subkey("OpenFlags", "Case")
 
-    with key_ref.open(create=True) as key:
+def test_open_create_true_creates_key(openflags_ref):
+    with openflags_ref.open(create=True) as key:
         key["created"] = "yes"
 
-    with key_ref.open() as key:
+    with openflags_ref.open() as key:
         assert key["created"] == "yes"
 
 
-def test_open_read_only_rejects_write(sandbox_key):
-    root = sandbox_key
-    key_ref = root.subkey("OpenFlags", "Case")
-
-    with key_ref.open(create=True) as key:
+@pytest.fixture
+def openflags_key(openflags_ref):
+    """The OpenFlags key ref, already created with a `created` value."""
+    with openflags_ref.open(create=True) as key:
         key["created"] = "yes"
+    return openflags_ref
+
 
-    with key_ref.open() as read_only:
+def test_open_read_only_rejects_write(openflags_key):
+    with openflags_key.open() as read_only:
         assert read_only["created"] == "yes"
         with pytest.raises(PermissionError):
             read_only["should_fail"] = "no"
 
 
-def test_open_write_true_allows_write(sandbox_key):
-    root = sandbox_key
-    key_ref = root.subkey("OpenFlags", "Case")
-
-    with key_ref.open(create=True) as key:
-        key["created"] = "yes"
-
-    with key_ref.open(write=True) as writable:
+def test_open_write_true_allows_write(openflags_key):
+    with openflags_key.open(write=True) as writable:
         writable["updated"] = "ok"
 
-    with key_ref.open() as key:
+    with openflags_key.open() as key:
         assert key["updated"] == "ok"
 
 
-def test_open_handle_on_open_key_raises_runtimeerror(sandbox_key):
-    root = sandbox_key
-    key_ref = root.subkey("OpenFlags", "Case")
-
-    with key_ref.open(create=True):
-        pass
-
-    with key_ref.open() as key:
+def test_open_handle_on_open_key_raises_runtimeerror(openflags_key):
+    with openflags_key.open() as key:
         with pytest.raises(RuntimeError):
             key.open_handle()
 
@@ -559,85 +519,138 @@ def test_create_accepts_backslash_path(sandbox_key):
         assert nested_open["leaf"] == "v"
 
 
-def test_value_set_and_get_untyped(sandbox_key):
-    root = sandbox_key
-
-    with root.create("Values") as key:
-        key["text"] = "hello"
-        key["count"] = 3
-        key["blob"] = b"\x00\x01"
-        key["none"] = None
-        key["tuple_set"] = ("tuple", fake.REG_SZ)
-        key.set_typed("expand", "%PATH%", fake.REG_EXPAND_SZ)
-
-    with root.open("Values") as key:
-        assert key["text"] == "hello"
-        assert key["count"] == 3
-        assert key["blob"] == b"\x00\x01"
-        assert key["none"] is None
-        assert key["tuple_set"] == "tuple"
-
-
-def test_value_typed_set_and_get(sandbox_key):
-    root = sandbox_key
-
-    with root.create("Values") as key:
-        key["count"] = 3
-        key["blob"] = b"\x00\x01"
-        key["none"] = None
-        key.set_typed("expand", "%PATH%", fake.REG_EXPAND_SZ)
-
-    with root.open("Values") as key:
-        assert key.get_typed("count") == (3, fake.REG_DWORD)
-        assert key.get_typed("blob") == (b"\x00\x01", fake.REG_BINARY)
-        assert key.get_typed("none") == (None, fake.REG_NONE)
-        assert key.get_typed("expand") == ("%PATH%", fake.REG_EXPAND_SZ)
-
-
-def test_value_iteration_methods(sandbox_key):
-    root = sandbox_key
-
-    with root.create("Values") as key:
-        key["text"] = "hello"
-        key["count"] = 3
-        key["blob"] = b"\x00\x01"
-
-    with root.open("Values") as key:
-        items = dict(key.items())
-        typed_items = dict(key.items_typed())
-        assert set(key.keys()) == set(items.keys())
-        assert len(list(key.values())) == len(items)
-        assert len(list(key.values_typed())) == len(typed_items)
+def test_delete_removes_leaf_key(sandbox_key):
+    with sandbox_key.create("Delete", "Leaf"):
+        pass
 
+    leaf = sandbox_key.subkey("Delete", "Leaf")
+    leaf.delete()
 
-def test_value_get_default_and_missing_typed(sandbox_key):
-    root = sandbox_key
+    assert not leaf.exists()
+    assert sandbox_key.subkey("Delete").exists()
 
-    with root.create("Values") as key:
-        key["count"] = 3
 
-    with root.open("Values") as key:
-        assert key.get("missing", "fallback") == "fallback"
-        assert key.get_typed("count") == (3, fake.REG_DWORD)
-        with pytest.raises(KeyError):
-            key.get_typed("missing")
+def test_delete_without_tree_rejects_key_with_subkeys(sandbox_key):
+    with sandbox_key.create("Delete", "Leaf"):
+        pass
 
+    parent = sandbox_key.subkey("Delete")
+    with pytest.raises(OSError):
+        parent.delete(tree=False)
 
-def test_value_deletion_methods(sandbox_key):
-    root = sandbox_key
+    assert parent.subkey("Leaf").exists()
 
-    with root.create("Values") as key:
-        key["text"] = "hello"
-        key["count"] = 3
 
-    with root.open("Values", write=True) as key:
-        key.value_del("text")
-        with pytest.raises(KeyError):
-            _ = key["text"]
+def test_delete_tree_removes_subtree(sandbox_key):
+    with sandbox_key.create("Delete", "A", "B") as key:
+        key["value"] = 1
+    with sandbox_key.create("Delete", "C"):
+        pass
 
-        del key["count"]
-        with pytest.raises(KeyError):
-            _ = key["count"]
+    parent = sandbox_key.subkey("Delete")
+    parent.delete(tree=True)
+
+    assert not parent.exists()
+    assert sandbox_key.exists()
+
+
+def test_delete_missing_key_honours_missing_ok(sandbox_key):
+    missing = sandbox_key.subkey("Missing")
+
+    missing.delete(missing_ok=True)
+    with pytest.raises(FileNotFoundError):
+        missing.delete(missing_ok=False)
+
+
+def test_delete_open_key_raises_value_error(sandbox_key):
+    with sandbox_key.create("Delete") as key:
+        with pytest.raises(ValueError):
+            key.delete()
+
+    assert sandbox_key.subkey("Delete").exists()
+
+
+class TestValues:
+    @pytest.fixture
+    def values_key(self, sandbox_key):
+        """A "Values" subkey under the sandbox, populated with one value of each kind."""
+        with sandbox_key.create("Values") as key:
+            key.update(
+                {
+                    "text": "hello",
+                    "count": 3,
+                    "blob": b"\x00\x01",
+                    "none": None,
+                    "tuple_set": ("tuple", fake.REG_SZ),
+                    "expand": ("%PATH%", fake.REG_EXPAND_SZ),
+                }
+            )
+        return sandbox_key.subkey("Values")
+
+    def test_value_set_and_get_untyped(self, values_key):
+        with values_key.open() as key:
+            assert key["text"] == "hello"
+            assert key.get_many(["count", "blob", "none", "tuple_set"]) == {
+                "count": 3,
+                "blob": b"\x00\x01",
+                "none": None,
+                "tuple_set": "tuple",
+            }
+            with pytest.raises(KeyError):
+                key.get_many(["text", "missing"])
+
+    def test_value_typed_set_and_get(self, values_key):
+        with values_key.open() as key:
+            assert key.get_typed("count") == (3, fake.REG_DWORD)
+            assert key.get_typed("blob") == (b"\x00\x01", fake.REG_BINARY)
+            assert key.get_typed("none") == (None, fake.REG_NONE)
+            assert key.get_typed("expand") == ("%PATH%", fake.REG_EXPAND_SZ)
+
+    def test_value_iteration_methods(self, values_key):
+        with values_key.open() as key:
+            # a single pass over items_typed() is the reference the other views must agree with
+            snapshot = list(key.items_typed())
+            assert len(snapshot) == len(key)
+
+            views = zip(key.keys(), key.items(), key.values(), key.values_typed(), strict=True)
+            for (name, (value, value_type)), view in zip(snapshot, views, strict=True):
+                assert view == (name, (name, value), value, (value, value_type))
+
+    def test_value_get_default_and_missing_typed(self, values_key):
+        with values_key.open() as key:
+            assert key.get("missing", "fallback") == "fallback"
+            assert key.get_typed("count") == (3, fake.REG_DWORD)
+            with pytest.raises(KeyError):
+                key.get_typed("missing")
+
+    def test_value_deletion_methods(self, values_key):
+        with values_key.open(write=True) as key:
+            key.value_del("text")
+            with pytest.raises(KeyError):
+                _ = key["text"]
+
+            del key["count"]
+            with pytest.raises(KeyError):
+                _ = key["count"]
+
+
+def test_update_accepts_pairs_and_keys(sandbox_key):
+    with sandbox_key.create("Src") as src, sandbox_key.create("Dst") as dst:
+        src.update([("ab", "x"), ("cd", ("y", fake.REG_EXPAND_SZ))])
+        assert src.get_typed("cd") == ("y", fake.REG_EXPAND_SZ)
+
+        # another key is read by name, like a mapping, not unpacked as pairs
+        dst.update(src)
+        assert dict(dst.items()) == {"ab": "x", "cd": "y"}
+
+
+def test_len_counts_values_and_empty_key_is_truthy(sandbox_key):
+    with sandbox_key.create("Len") as key:
+        assert len(key) == 0
+        assert key
+
+        key.update({"a": "1", "b": "2"})
+        assert len(key) == 2
 
 
 def test_default_value_set_delete_accept_none_name(sandbox_key):
@@ -646,6 +659,7 @@ def test_default_value_set_delete_accept_none_name(sandbox_key):
     with root.create("Values") as key:
         key[None] = "default"
         assert key[""] == "default"
+        assert None in key
 
         key.set_typed(None, "typed-default", fake.REG_SZ)
         assert key[""] == "typed-default"
@@ -656,6 +670,7 @@ def test_default_value_set_delete_accept_none_name(sandbox_key):
 
         key[None] = "default-again"
         del key[None]
+        assert None not in key
         with pytest.raises(KeyError):
             _ = key[""]
 
@@ -705,86 +720,75 @@ def test_from_dict_prefers_values_typed_when_present(sandbox_key):
 @pytest.mark.skipif(sys.platform != "win32", reason="real winreg tests require Windows")
 @pytest.mark.usefixtures("require_real_winreg")
 class TestKeyRealReadOnly:
-    def test_enumerate_root_subkeys(self):
-        from src.regkit.registry import Key
-
-        with Key.current_user() as root:
-            names = [sub.name for sub in root.subkeys()]
-            assert isinstance(names, list)
-
-    def test_iterate_values_and_types(self):
-        from src.regkit.registry import Key
-
-        with Key.current_user() as root:
-            items_typed = list(root.items_typed())
-            values_typed = list(root.values_typed())
-
-            assert len(items_typed) == len(values_typed)
-
-            if items_typed:
-                name, (value, value_type) = items_typed[0]
-                fetched_value, fetched_type = root.get_typed(name)
-                assert fetched_value == value
-                assert fetched_type == value_type
-
-    def test_open_first_subkey_and_enumerate(self):
-        from src.regkit.registry import Key
-
-        with Key.current_user() as root:
-            first_subkey = next(root.subkeys(), None)
-            if first_subkey is None:
-                pytest.skip("No subkeys found under HKCU")
-
-            with root.open(first_subkey.name) as sub:
-                _ = list(sub.subkeys())
-                _ = list(sub.items())
-                _ = list(sub.items_typed())
-
-    def test_depth_first_hkcu_snapshot_is_tree_like(self):
-        from src.regkit.registry import Key
-
+    def test_enumerate_root_subkeys(self, hkcu_root):
+        names = [sub.name for sub in hkcu_root.subkeys()]
+        assert isinstance(names, list)
+
+    def test_iterate_values_and_types(self, hkcu_root):
+        # walk both views in lockstep; strict zip fails if their lengths differ
+        first = None
+        for (name, value_typed), other in zip(hkcu_root.items_typed(), hkcu_root.values_typed(), strict=True):
+            assert value_typed == other
+            if first is None:
+                first = (name, value_typed)
+
+        if first is not None:
+            name, (value, value_type) = first
+            fetched_value, fetched_type = hkcu_root.get_typed(name)
+            assert fetched_value == value
+            assert fetched_type == value_type
+
+    def test_open_first_subkey_and_enumerate(self, hkcu_root):
+        first_subkey = next(hkcu_root.subkeys(), None)
+        if first_subkey is None:
+            pytest.skip("No subkeys found under HKCU")
+
+        # only the first entry of each view is pulled, so large values are not decoded
+        with hkcu_root.open(first_subkey.name) as sub:
+            next(sub.subkeys(), None)
+            next(sub.items(), None)
+            next(sub.items_typed(), None)
+
+    def test_depth_first_hkcu_snapshot_is_tree_like(self, hkcu_root):
         max_keys = 100
         visited = 0
-        typed_value_iterations = []
+        # values are only fetched on demand; the walk itself reads just the names
+        value_fetchers = []
 
-        def walk(parent, key_name):
-            nonlocal visited
-            node = {"name": key_name, "values": [], "children": []}
-            try:
-                with parent.open(key_name) as key:
-                    for name, (value, value_type) in key.items_typed():
-                        node["values"].append(name)
-                        typed_value_iterations.append((name, value, value_type))
-                    if visited >= max_keys:
-                        return node
-
-                    for sub in key.subkeys():
-                        if visited >= max_keys:
-                            break
-                        visited += 1
-                        try:
-                            child = walk(key, sub.name)
-                        except (PermissionError, OSError, KeyError):
-                            continue
-                        node["children"].append(child)
-            except (PermissionError, OSError, KeyError):
-                return node
+        def fetch_typed(ref, name):
+            with ref.open() as key:
+                return key.get_typed(name)
 
-            return node
+        # explicit stack of (unopened subkey, node) instead of recursion; each key
+        # is closed before its children are opened, so only one handle is held
+        stack = deque()
 
-        with Key.current_user() as root:
-            snapshot = {"name": "HKEY_CURRENT_USER", "values": [], "children": []}
-            for name, (value, value_type) in root.items_typed():
-                snapshot["values"].append(name)
-                typed_value_iterations.append((name, value, value_type))
-            for sub in root.subkeys():
+        def push_children(key, node):
+            nonlocal visited
+            for sub in key.subkeys():
                 if visited >= max_keys:
                     break
                 visited += 1
-                try:
-                    snapshot["children"].append(walk(root, sub.name))
-                except (PermissionError, OSError, KeyError):
-                    continue
+                child = {"name": sub.name, "values": [], "children": []}
+                node["children"].append(child)
+                stack.append((sub, child))
+
+        snapshot = {"name": "HKEY_CURRENT_USER", "values": [], "children": []}
+        for name in hkcu_root.keys():
+            snapshot["values"].append(name)
+            value_fetchers.append(partial(hkcu_root.get_typed, name))
+        push_children(hkcu_root, snapshot)
+
+        while stack:
+            sub, node = stack.pop()
+            try:
+                with sub.open() as key:
+                    for name in key.keys():
+                        node["values"].append(name)
+                        value_fetchers.append(partial(fetch_typed, sub, name))
+                    push_children(key, node)
+            except (PermissionError, OSError, KeyError):
+                continue
 
         assert visited > 0
         assert isinstance(snapshot["children"], list)
@@ -799,5 +803,7 @@ class TestKeyRealReadOnly:
                 seen_nested = True
             stack.extend(node["children"])
 
-        assert typed_value_iterations
+        assert value_fetchers
+        _, value_type = value_fetchers[0]()
+        assert isinstance(value_type, int)
         assert seen_nested or any(node["values"] for node in snapshot["children"])